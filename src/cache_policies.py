@@ -15,6 +15,11 @@ class ReplacementPolicy:
     def hit(self, address):
         self.hit_address = address
 
+    def bulk_hit(self, address, count):
+        # Same effect as calling hit() count times in a row
+        for _ in range(count):
+            self.hit(address)
+
     def miss(self, address, data):
         self.data = data
         self.miss_address = address
@@ -32,6 +37,9 @@ class LRU(ReplacementPolicy):
     def hit(self, address):
         self.use[address] += 1
 
+    def bulk_hit(self, address, count):
+        self.use[address] += count
+
     def miss(self, address, data):
         self.order[address] = data
         self.use[address] = 0
@@ -50,6 +58,9 @@ class FIFO(ReplacementPolicy):
     def hit(self, address):
         return super().hit(address)
 
+    def bulk_hit(self, address, count):
+        return super().hit(address)
+
     def miss(self, address, data):
         self.order[address] = data
         self.cache.cache = self.order
@@ -66,6 +77,9 @@ class Random(ReplacementPolicy):
     def hit(self, address):
         return super().hit(address)
 
+    def bulk_hit(self, address, count):
+        return super().hit(address)
+
     def miss(self, address, data):
         self.order[address] = data
         self.cache.cache = self.order
@@ -83,6 +97,9 @@ class MRU(ReplacementPolicy):
     def hit(self, address):
         self.use[address] += 1
 
+    def bulk_hit(self, address, count):
+        self.use[address] += count
+
     def miss(self, address, data):
         self.order[address] = data
         self.use[address] = 0
@@ -105,6 +122,11 @@ class SecondChance(ReplacementPolicy):
         for addr in self.how_long:
             self.how_long[addr] += 1
 
+    def bulk_hit(self, address, count):
+        self.frequency[address] = 1
+        for addr in self.how_long:
+            self.how_long[addr] += count
+
     def miss(self, address, data):
         self.order[address] = data
         self.frequency[address] = 0
@@ -132,6 +154,9 @@ class LFU(ReplacementPolicy):
     def hit(self, address):
         self.frequency[address] += 1
 
+    def bulk_hit(self, address, count):
+        self.frequency[address] += count
+
     def miss(self, address, data):
         self.order[address] = data
         self.frequency[address] = 1
@@ -179,6 +204,12 @@ class LFRU(ReplacementPolicy):
             self.order = self.privileged_cache | self.unprivileged_cache
             self.cache.cache = self.order
 
+    def bulk_hit(self, address, count):
+        # Only the first hit can promote; the rest just count as privileged use
+        self.hit(address)
+        if count > 1 and address in self.privileged_cache:
+            self.privileged_use[address] += count - 1
+
     def miss(self, address, data):
         items = list(self.order.items())
         self.privileged_cache = OrderedDict(items[:self.privileged_size])
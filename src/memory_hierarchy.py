@@ -39,6 +39,12 @@ class CacheMemory(MemoryLevel):
             self.replacement_policy.miss(block_address, data)
             return data, False, self.access_time + lower_access_time, name
 
+    def access_repeated(self, address, count):
+        # The block must already be cached, e.g. by the access() just before
+        self.access_count += count
+        self.replacement_policy.bulk_hit(address // self.block_size, count)
+        return self.cache[address // self.block_size], True, self.access_time, self.name
+
 
 class MainMemory(MemoryLevel):
     def __init__(self, name, size, access_time, lower_level=None):
@@ -1,22 +1,188 @@
 # src/performance_analysis.py
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 
+ROW_DTYPE = np.dtype([('access', np.int64), ('hits', np.int64), ('misses', np.int64),
+                      ('hit_rate', np.float64), ('avg_access_time', np.float64)])
+
+
 class PerformanceAnalysis:
-    def __init__(self, simulator):
+    def __init__(self, simulator, interval=1000, capacity=4096, plot_points=512, report_path=None):
         self.total_hits = 0
         self.total_misses = 0
         self.total_accesses = 0
         self.simulator = simulator
+        self.interval = interval
+        self.capacity = capacity
+        # Must be even so that adjacent buckets can be merged in pairs
+        self.plot_points = plot_points + plot_points % 2
+        self.report_path = report_path
+        if report_path is not None and report_path.endswith('.parquet'):
+            try:
+                import pyarrow.parquet  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "Parquet reports require pyarrow (pip install pyarrow)")
+
+        # Per-interval metrics, preallocated once and reused as a ring
+        self.buffer = np.zeros(capacity, dtype=ROW_DTYPE)
+        # Whole-run decimated hit rate, fixed size regardless of run length
+        self.plot_x = np.zeros(self.plot_points)
+        self.plot_min = np.zeros(self.plot_points)
+        self.plot_max = np.zeros(self.plot_points)
+        self.plot_hits = np.zeros(self.plot_points, dtype=np.int64)
+        self.plot_accesses = np.zeros(self.plot_points, dtype=np.int64)
+
+        self.figure = None
+        self.axes = None
+        self.writer = None
+        self.reset()
+
+    def start(self, simulator, interval=None):
+        self.close()
+        self.simulator = simulator
+        if interval is not None:
+            self.interval = interval
+        self.reset()
+
+    def reset(self):
+        self.accesses = 0
+        self.interval_hits = 0
+        self.interval_misses = 0
+        self.interval_access_time = 0
+        self.intervals = 0
+        self.pending = 0
+        self.plot_count = 0
+        self.bucket_fill = 0
+        self.bucket_width = 1
+        self.header_written = False
 
     def update_metrics(self, hits, misses, accesses):
         self.total_hits += hits
         self.total_misses += misses
         self.total_accesses += accesses
 
-    def visualize(self, data):
-        df = pd.DataFrame(data)
-        df.plot(kind='bar')
-        plt.title('Access Resault')
-        plt.show()
+    def record(self, hit, access_time):
+        self.accesses += 1
+        if hit:
+            self.interval_hits += 1
+        else:
+            self.interval_misses += 1
+        self.interval_access_time += access_time
+        if self.interval_hits + self.interval_misses >= self.interval:
+            self.record_interval()
+
+    def record_hits(self, count, access_time):
+        while count:
+            step = min(count, self.interval - self.interval_hits - self.interval_misses)
+            self.accesses += step
+            self.interval_hits += step
+            self.interval_access_time += access_time * step
+            count -= step
+            if self.interval_hits + self.interval_misses >= self.interval:
+                self.record_interval()
+
+    def record_interval(self):
+        count = self.interval_hits + self.interval_misses
+        if not count:
+            return
+        hits = self.interval_hits
+        hit_rate = hits / count
+        row = self.intervals % self.capacity
+        self.buffer[row] = (self.accesses, hits, self.interval_misses,
+                            hit_rate, self.interval_access_time / count)
+        self.intervals += 1
+        self.interval_hits = 0
+        self.interval_misses = 0
+        self.interval_access_time = 0
+        self.decimate(self.accesses, hit_rate, hits, count)
+
+        self.pending += 1
+        if self.pending == self.capacity:
+            self.write_pending()
+
+    def decimate(self, access, hit_rate, hits, count):
+        i = self.plot_count
+        if self.bucket_fill:
+            self.plot_min[i] = min(self.plot_min[i], hit_rate)
+            self.plot_max[i] = max(self.plot_max[i], hit_rate)
+            self.plot_hits[i] += hits
+            self.plot_accesses[i] += count
+        else:
+            self.plot_min[i] = self.plot_max[i] = hit_rate
+            self.plot_hits[i] = hits
+            self.plot_accesses[i] = count
+        self.plot_x[i] = access
+        self.bucket_fill += 1
+        if self.bucket_fill < self.bucket_width:
+            return
+
+        self.bucket_fill = 0
+        self.plot_count += 1
+        if self.plot_count == self.plot_points:
+            # Out of room: merge neighbouring buckets and double their width
+            half = self.plot_points // 2
+            self.plot_min[:half] = np.minimum(
+                self.plot_min[0::2], self.plot_min[1::2])
+            self.plot_max[:half] = np.maximum(
+                self.plot_max[0::2], self.plot_max[1::2])
+            self.plot_hits[:half] = self.plot_hits[0::2] + self.plot_hits[1::2]
+            self.plot_accesses[:half] = (
+                self.plot_accesses[0::2] + self.plot_accesses[1::2])
+            self.plot_x[:half] = self.plot_x[1::2]
+            self.plot_count = half
+            self.bucket_width *= 2
+
+    def flush(self):
+        # Close off the interval in progress so the report is complete so far
+        self.record_interval()
+        self.write_pending()
+
+    def write_pending(self):
+        if not self.pending:
+            return
+        rows = (self.intervals - self.pending +
+                np.arange(self.pending)) % self.capacity
+        self.pending = 0
+        if self.report_path is None:
+            return
+        df = pd.DataFrame(self.buffer[rows])
+        if self.report_path.endswith('.parquet'):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self.writer is None:
+                self.writer = pq.ParquetWriter(self.report_path, table.schema)
+            self.writer.write_table(table)
+        else:
+            df.to_csv(self.report_path, mode='a' if self.header_written else 'w',
+                      header=not self.header_written, index=False)
+            self.header_written = True
+
+    def close(self):
+        self.flush()
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+    def visualize(self):
+        # Plots completed intervals only; call flush() first to include the current one
+        count = self.plot_count + (1 if self.bucket_fill else 0)
+        x = self.plot_x[:count]
+        mean = self.plot_hits[:count] / self.plot_accesses[:count]
+        if self.figure is None or not plt.fignum_exists(self.figure.number):
+            self.figure, self.axes = plt.subplots()
+        self.axes.clear()
+        self.axes.fill_between(x, self.plot_min[:count], self.plot_max[:count],
+                               alpha=0.3, label='min/max')
+        self.axes.plot(x, mean, marker='.', label='hit rate')
+        self.axes.set_xlabel('Accesses')
+        self.axes.set_ylabel('Hit Rate')
+        self.axes.set_ylim(0, 1)
+        self.axes.legend()
+        self.axes.set_title('Hit Rate Over Time')
+        self.figure.canvas.draw_idle()
+        plt.show(block=False)
+        self.figure.canvas.flush_events()
@@ -1,7 +1,15 @@
 # src/simulation.py
+from itertools import groupby
 from memory_hierarchy import CacheMemory
 
 
+def compact_trace(addresses, block_size):
+    # Collapse consecutive accesses to the same block into (address, count) runs
+    for _, run in groupby(addresses, key=lambda address: address // block_size):
+        address = next(run)
+        yield address, 1 + sum(1 for _ in run)
+
+
 class MemoryAccessSimulation:
     def __init__(self, memory_hierarchy):
         self.memory_hierarchy = memory_hierarchy
@@ -23,6 +31,16 @@ class MemoryAccessSimulation:
         self.misses += 1
         return False, -1, "all cache levels"
 
+    def access_repeated(self, address, count):
+        # Re-access the block just brought in by access_address, count more times
+        data, _, access_time, name = self.first_cache.access_repeated(
+            address, count)
+        self.accesses += count
+        self.hits += count
+        self.access_time = access_time
+        self.total_access_time += access_time * count
+        return True, data, name
+
     def get_cache_contents(self):
         cache_contents = {}
         for memory in self.memory_hierarchy:
@@ -1,25 +1,32 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from memory_hierarchy import CacheMemory, MainMemory, ExternalMemory
-from simulation import MemoryAccessSimulation
+from simulation import MemoryAccessSimulation, compact_trace
 from performance_analysis import PerformanceAnalysis
 from cache_policies import LRU, FIFO, Random, MRU, SecondChance, LFU, LFRU
 import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 import random
+import os
 
 L1_CACHE = "L1 Cache"
 L2_CACHE = "L2 Cache"
 L3_CACHE = "L3 Cache"
 MAIN_MEMORY = "Main Memory"
 EXTERNAL_MEMORY = "External Memory"
+# Rewritten at the start of every simulation run
+REPORT_PATH = os.path.join(os.path.dirname(
+    os.path.abspath(__file__)), "performance_report.csv")
+# Upper bound on report rows per run; short runs get one row per access
+REPORT_ROWS = 500
 
 
 class MemoryHierarchySimulatorUI:
     def __init__(self, root):
         self.root = root
         self.root.title("Memory Hierarchy Simulator")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.create_widgets()
         self.default_memory_hierarchy()
@@ -36,7 +43,8 @@ class MemoryHierarchySimulatorUI:
         self.memory_hierarchy = [l1_cache, l2_cache,
                                  l3_cache, main_memory, external_memory]
         self.simulator = MemoryAccessSimulation(self.memory_hierarchy)
-        self.performance_analyzer = PerformanceAnalysis(self.simulator)
+        self.performance_analyzer = PerformanceAnalysis(
+            self.simulator, report_path=REPORT_PATH)
 
     def create_widgets(self):
         self.root.columnconfigure(0, weight=1)
@@ -262,6 +270,8 @@ class MemoryHierarchySimulatorUI:
         memory_hierarchy.append(main_memory)
         memory_hierarchy.append(external_memory)
         self.simulator = MemoryAccessSimulation(memory_hierarchy)
+        self.performance_analyzer.start(
+            self.simulator, interval=max(1, -(-count // REPORT_ROWS)))
 
         if pattern == "Sequential":
             addresses = range(count)
@@ -271,11 +281,18 @@ class MemoryHierarchySimulatorUI:
         else:
             raise ValueError("Unknown access pattern")
 
-        for address in addresses:
-            self.simulator.access_address(address)
+        for address, run in compact_trace(addresses, block_size):
+            hit, _, _ = self.simulator.access_address(address)
+            self.performance_analyzer.record(hit, self.simulator.access_time)
+            if run > 1:
+                self.simulator.access_repeated(address, run - 1)
+                self.performance_analyzer.record_hits(
+                    run - 1, self.simulator.access_time)
 
         self.performance_analyzer.update_metrics(
             self.simulator.hits, self.simulator.misses, self.simulator.accesses)
+        self.performance_analyzer.flush()
+        self.performance_analyzer.visualize()
 
         self.show_results_window()
         self.update_cache_contents_text()
@@ -299,26 +316,20 @@ class MemoryHierarchySimulatorUI:
 
         for address in addresses:
             hit, _, memory_name = self.simulator.access_address(address)
+            self.performance_analyzer.record(hit, self.simulator.access_time)
             result = "Hit" if hit else "Miss"
             self.result_text.insert(tk.END, f"Address {address}: "
                                     f"{result} in {memory_name}\n")
             self.update_cache_contents_text()
 
         self.stats_label.config(text=self.generate_stats_text())
-        hit_rate = self.simulator.hits / \
-            self.simulator.accesses if self.simulator.accesses else 0
-        miss_rate = self.simulator.misses / \
-            self.simulator.accesses if self.simulator.accesses else 0
-
-        self.data = {
-            'hit_rate': [],
-            'miss_rate': []
-        }
-
-        self.data['hit_rate'].append(hit_rate)
-        self.data['miss_rate'].append(miss_rate)
+        self.performance_analyzer.flush()
+        self.performance_analyzer.visualize()
 
-        self.performance_analyzer.visualize(self.data)
+    def on_close(self):
+        self.performance_analyzer.close()
+        plt.close('all')
+        self.root.destroy()
 
     def update_cache_contents_text(self):
         cache_contents = self.simulator.get_cache_contents()